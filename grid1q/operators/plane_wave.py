@@ -1,17 +1,93 @@
 """Plane wave Hamiltonian for a ND system."""
 
-import multiprocessing
+import math
+from types import ModuleType
+from typing import Any
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
+
+try:
+    from scipy.sparse.linalg import LinearOperator
+except ImportError:  # pragma: no cover
+    LinearOperator = None
+
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+try:
+    import cupy
+except ImportError:  # pragma: no cover
+    cupy = None
+
+# Rows of the potential matrix evaluated per block in the tiled implementation
+_POTENTIAL_TILE = 128
+
+
+def _split_soa(
+    points: NDArray[np.floating[Any]],
+    xp: ModuleType = np,
+) -> tuple[NDArray[np.floating[Any]], ...]:
+    """Split (N, D) points into D contiguous length N component arrays.
+
+    Args:
+        points: The points, one per row.
+        xp: The array module holding the points, either numpy or cupy.
+
+    Returns:
+        The x, y, ... components of the points.
+    """
+    return tuple(xp.ascontiguousarray(component) for component in points.T)
+
+
+def _complex_dtype(dtype: DTypeLike) -> np.dtype[Any]:
+    """Return dtype as a NumPy dtype, checking that it is complex.
+
+    Args:
+        dtype: The requested data type.
+
+    Returns:
+        The data type as a NumPy dtype.
+
+    Raises:
+        TypeError: If the data type is not a complex floating type.
+    """
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.complexfloating):
+        msg = f"dtype must be a complex floating type, got {dtype}."
+        raise TypeError(msg)
+    return dtype
+
+
+def _as_points(points: NDArray[Any], dtype: DTypeLike) -> NDArray[np.floating[Any]]:
+    """Return points as an (N, D) array of the given real data type.
+
+    1D points may be given as a flat (N,) array, which is treated as (N, 1).
+
+    Args:
+        points: The points, one per row, or one scalar each in 1D.
+        dtype: The real data type of the result.
+
+    Returns:
+        The points as an (N, D) array.
+    """
+    points = np.asarray(points, dtype=dtype)
+    if points.ndim == 1:
+        points = points[:, None]
+    return points
 
 
 def kenetic(
     k_points: NDArray[np.int32],
     hbar: float = 1.0,
     m: float = 1.0,
-) -> NDArray[np.complex128]:
-    """Return the diagonal kinetic energy matrix for a ND plane wave system.
+) -> NDArray[np.float64]:
+    """Return the diagonal of the kinetic energy matrix for a ND plane wave system.
+
+    The kinetic energy matrix is diagonal in the plane wave basis, so only the
+    diagonal is returned. Use np.diag to recover the full matrix.
 
     Args:
         k_points: The k points of the system.
@@ -19,112 +95,294 @@ def kenetic(
         m: The mass of the particle.
 
     Returns:
-        The digonal kinetic energy matrix.
+        The diagonal of the kinetic energy matrix.
     """
-    return np.diag([(hbar**2 * np.dot(k, k) ** 2) / (2 * m) for k in k_points])
+    k_points = _as_points(k_points, np.float64)
+    k2 = sum(k_d * k_d for k_d in _split_soa(k_points))
+    return (hbar * hbar) * (k2 * k2) / (2.0 * m)
 
 
-def elec_nuc_potential_element(
-    args: tuple[
-        int,
-        int,
-        NDArray[np.int32],
-        NDArray[np.int32],
-        NDArray[np.float64],
-        float,
-    ],
-) -> tuple[int, int, complex]:
-    """Return the matrix element of the electron-nucleus potential.
+def _elec_nuc_potential_tiled(
+    k_points: NDArray[np.floating[Any]],
+    cell_area: float,
+    r_pos: NDArray[np.floating[Any]],
+    mat: NDArray[np.complexfloating[Any, Any]],
+    xp: ModuleType = np,
+) -> None:
+    """Fill the electron-nucleus potential matrix using array broadcasting.
 
-    This functions is parallelized and should be used with the multiprocessing
-    module. Where the each matrix element will be calculated in parallel.
+    The rows are evaluated in blocks of _POTENTIAL_TILE so the pairwise
+    intermediates stay of shape (tile, N) rather than (N, N). The k point
+    differences are formed per component, so no (tile, N, D) array is built.
+    Only the blocks on and above the diagonal are computed, the rest follows
+    from the matrix being Hermitian.
 
     Args:
-        args: A tuple containing the following elements:
-            i: The row index of the matrix element.
-            j: The column index of the matrix element.
-            k_bra: The bra k point.
-            k_ket: The ket k point.
-            r_pos: The position of the nucleus.
+        k_points: The k points of the system.
+        cell_area: The area of the cell.
+        r_pos: The position of the nucleus.
+        mat: The (N, N) output matrix, overwritten in place.
+        xp: The array module holding the arrays, either numpy or cupy.
+    """
+    n_k = len(k_points)
+    k_soa = _split_soa(k_points, xp)
+    for i0 in range(0, n_k, _POTENTIAL_TILE):
+        i1 = min(i0 + _POTENTIAL_TILE, n_k)
+        d_k = [k_d[i0:i1, None] - k_d[None, i0:] for k_d in k_soa]
+        norm2 = sum(d_k_d * d_k_d for d_k_d in d_k)
+        phase = xp.zeros(norm2.shape, dtype=mat.dtype)
+        for r in r_pos:
+            k_dot_r = sum(d_k_d * r_d for d_k_d, r_d in zip(d_k, r, strict=True))
+            phase += xp.exp(-1j * k_dot_r)
+
+        # Zero the equal k point terms arithmetically, the denominator is
+        # shifted to one there so no division by zero is ever evaluated
+        nonzero = norm2 > 0
+        scale = nonzero * ((4 * np.pi) / (cell_area * (norm2 + ~nonzero)))
+        block = scale * phase
+        mat[i0:i1, i0:] = block
+        mat[i0:, i0:i1] = block.conj().T
+
+
+if numba is not None:
+
+    @numba.njit(fastmath=True, cache=True, inline="always")
+    def _elec_nuc_potential_row(
+        k_points: NDArray[np.floating[Any]],
+        cell_area: float,
+        r_pos: NDArray[np.floating[Any]],
+        mat: NDArray[np.complexfloating[Any, Any]],
+        i: int,
+    ) -> None:
+        """Fill row i of the potential matrix right of the diagonal, and mirror it.
+
+        Each element makes one pass over the D components to accumulate |dK|^2.
+        It then makes one more pass per nucleus to accumulate dK . r,
+        recomputing k_i[d] - k_j[d] from the inputs each time. Every
+        difference is a scalar local, so no dK array is allocated, not even per
+        element. Recomputing the few differences was measured to be faster
+        than keeping per nucleus sums in a scratch buffer.
+
+        Args:
+            k_points: The k points of the system.
             cell_area: The area of the cell.
+            r_pos: The position of the nucleus.
+            mat: The (N, N) output matrix, overwritten in place.
+            i: The row to fill.
+        """
+        n_k, n_dim = k_points.shape
+        n_r = r_pos.shape[0]
+        mat[i, i] = 0
+        for j in range(i + 1, n_k):
+            norm2 = 0.0
+            for d in range(n_dim):
+                d_k = k_points[i, d] - k_points[j, d]
+                norm2 += d_k * d_k
+            phase = 0j
+            for r in range(n_r):
+                k_dot_r = 0.0
+                for d in range(n_dim):
+                    k_dot_r += (k_points[i, d] - k_points[j, d]) * r_pos[r, d]
+                phase += complex(math.cos(k_dot_r), -math.sin(k_dot_r))
+            nonzero = norm2 > 0
+            scale = nonzero * ((4 * np.pi) / (cell_area * (norm2 + (not nonzero))))
+            mat[i, j] = scale * phase
+            mat[j, i] = np.conj(mat[i, j])
 
-    Returns:
-        The matrix element of the electron-nucleus potential.
-    """
-    i, j, k_bra, k_ket, r_pos, cell_area = args
-    mat_element = 0
-    for r in r_pos:
-        if np.array_equal(k_bra, k_ket):
-            mat_element = 0
-        else:
-            mat_element += (
-                (4 * np.pi) / (cell_area * np.linalg.norm(k_bra - k_ket) ** 2)
-            ) * np.exp(-1j * np.dot(k_bra - k_ket, r))
-    return i, j, mat_element
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _elec_nuc_potential_numba(
+        k_points: NDArray[np.floating[Any]],
+        cell_area: float,
+        r_pos: NDArray[np.floating[Any]],
+        mat: NDArray[np.complexfloating[Any, Any]],
+    ) -> None:
+        """Fill the electron-nucleus potential matrix using a fused Numba kernel.
+
+        Only the upper triangle is evaluated and mirrored, as the matrix is
+        Hermitian. Row i of the triangle holds N - 1 - i elements, so each
+        parallel iteration fills rows i and N - 1 - i together. Every iteration
+        then does N - 1 elements, and the static chunking of prange splits the
+        work evenly across threads.
+
+        Args:
+            k_points: The k points of the system.
+            cell_area: The area of the cell.
+            r_pos: The position of the nucleus.
+            mat: The (N, N) output matrix, overwritten in place.
+        """
+        n_k = k_points.shape[0]
+        for i in numba.prange((n_k + 1) // 2):
+            _elec_nuc_potential_row(k_points, cell_area, r_pos, mat, i)
+            if n_k - 1 - i != i:
+                _elec_nuc_potential_row(k_points, cell_area, r_pos, mat, n_k - 1 - i)
 
 
 def elec_nuc_potential(
     k_points: NDArray[np.int32],
     cell_area: float,
     r_pos: NDArray[np.float64],
-) -> NDArray[np.complex128]:
+    *,
+    dtype: DTypeLike = np.complex64,
+    use_gpu: bool = False,
+) -> NDArray[np.complexfloating[Any, Any]]:
     """Return the electron-nucleus potential matrix for a ND plane wave system.
 
-    This function is parallelized and should be used with the multiprocessing.
+    The matrix elements are evaluated for all pairs of k points at once. The
+    diagonal, where the k points are equal, is set to zero. With use_gpu the
+    matrix is assembled on the GPU with CuPy and copied back to the host.
+    Otherwise, if Numba is installed a compiled parallel kernel is used, else
+    NumPy.
 
     Args:
         k_points: The k points of the system.
         cell_area: The area of the cell.
-        r_pos: The position of the nucleus.
+        r_pos: The position of the nucleus. In 1D these may be given as a flat
+            array, as may the k points.
+        dtype: The complex data type of the matrix. The k points and nuclear
+            positions are cast to the matching real precision.
+        use_gpu: Whether to assemble the matrix on the GPU, requires CuPy.
 
     Returns:
         The electron-nucleus potential matrix.
+
+    Raises:
+        ValueError: If the k points and nuclear positions differ in dimension.
+        TypeError: If dtype is not a complex floating type.
+        ImportError: If use_gpu is set and CuPy is not installed.
     """
-    mat = np.zeros((len(k_points), len(k_points)), dtype=complex)
-    args_list: list[
-        tuple[
-            tuple[
-                int,
-                int,
-                NDArray[np.int32],
-                NDArray[np.int32],
-                NDArray[np.float64],
-                float,
-            ]
-        ]
-    ] = []
-    for i, k_bra in enumerate(k_points):
-        for j, k_ket in enumerate(k_points):
-            args_list.append((i, j, k_bra, k_ket, r_pos, cell_area))
-
-    with multiprocessing.Pool() as pool:
-        results = pool.map(elec_nuc_potential_element, args_list)
-
-    for i, j, mat_element in results:
-        mat[i, j] = mat_element
+    dtype = _complex_dtype(dtype)
+    real_dtype = np.finfo(dtype).dtype
+    k_points = _as_points(k_points, real_dtype)
+    r_pos = _as_points(r_pos, real_dtype)
+    if k_points.shape[1] != r_pos.shape[1]:
+        msg = (
+            f"k points are {k_points.shape[1]}D but nuclear positions are "
+            f"{r_pos.shape[1]}D."
+        )
+        raise ValueError(msg)
+
+    if use_gpu:
+        if cupy is None:
+            msg = "use_gpu requires CuPy to be installed."
+            raise ImportError(msg)
+        k_points_gpu = cupy.asarray(k_points)
+        r_pos_gpu = cupy.asarray(r_pos)
+        mat_gpu = cupy.empty((len(k_points_gpu), len(k_points_gpu)), dtype=dtype)
+        _elec_nuc_potential_tiled(
+            k_points_gpu,
+            cell_area,
+            r_pos_gpu,
+            mat_gpu,
+            xp=cupy,
+        )
+        return cupy.asnumpy(mat_gpu)
+
+    mat = np.empty((len(k_points), len(k_points)), dtype=dtype)
 
+    if numba is not None:
+        _elec_nuc_potential_numba(k_points, cell_area, r_pos, mat)
+    else:
+        _elec_nuc_potential_tiled(k_points, cell_area, r_pos, mat)
     return mat
 
 
-def plane_wave_hamiltonian(
+def plane_wave_hamiltonian(  # noqa: PLR0913
     k_points: NDArray[np.int32],
     cell_area: float,
     r_pos: NDArray[np.float64],
     hbar: float = 1.0,
     m: float = 1.0,
-) -> NDArray[np.complex128]:
+    *,
+    dtype: DTypeLike = np.complex64,
+    use_gpu: bool = False,
+) -> NDArray[np.complexfloating[Any, Any]]:
     """Return the Hamiltonian matrix for a ND plane wave system.
 
-    This function is parallelized and should be used with the multiprocessing.
-
     Args:
         k_points: The k points of the system.
         cell_area: The area of the cell.
         r_pos: The position of the nucleus.
         hbar: The reduced Planck constant.
         m: The mass of the particle.
+        dtype: The complex data type of the matrix.
+        use_gpu: Whether to assemble the potential on the GPU, requires CuPy.
 
     Returns:
     The Hamiltonian matrix.
+
+    Raises:
+        TypeError: If dtype is not a complex floating type.
+    """
+    hamiltonian = elec_nuc_potential(
+        k_points,
+        cell_area,
+        r_pos,
+        dtype=dtype,
+        use_gpu=use_gpu,
+    )
+    hamiltonian[np.diag_indices_from(hamiltonian)] += kenetic(k_points, hbar, m)
+    return hamiltonian
+
+
+def plane_wave_hamiltonian_linop(  # noqa: PLR0913
+    k_points: NDArray[np.int32],
+    cell_area: float,
+    r_pos: NDArray[np.float64],
+    hbar: float = 1.0,
+    m: float = 1.0,
+    *,
+    dtype: DTypeLike = np.complex64,
+    use_gpu: bool = False,
+) -> LinearOperator:
+    """Return the Hamiltonian for a ND plane wave system as a LinearOperator.
+
+    The kinetic energy is kept as its diagonal and the potential as a dense
+    matrix, so the summed Hamiltonian is never materialised. This is suited to
+    iterative eigensolvers such as scipy.sparse.linalg.eigsh, which only need
+    matrix-vector products.
+
+    Args:
+        k_points: The k points of the system.
+        cell_area: The area of the cell.
+        r_pos: The position of the nucleus.
+        hbar: The reduced Planck constant.
+        m: The mass of the particle.
+        dtype: The complex data type of the operator.
+        use_gpu: Whether to assemble the potential on the GPU, requires CuPy.
+
+    Returns:
+        The Hamiltonian as a Hermitian LinearOperator.
+
+    Raises:
+        ImportError: If SciPy is not installed.
+        TypeError: If dtype is not a complex floating type.
     """
-    return kenetic(k_points, hbar, m) + elec_nuc_potential(k_points, cell_area, r_pos)
+    if LinearOperator is None:
+        msg = "plane_wave_hamiltonian_linop requires SciPy to be installed."
+        raise ImportError(msg)
+
+    potential = elec_nuc_potential(
+        k_points,
+        cell_area,
+        r_pos,
+        dtype=dtype,
+        use_gpu=use_gpu,
+    )
+    kinetic_diag = kenetic(k_points, hbar, m).astype(potential.real.dtype)
+
+    def matvec(x: NDArray[np.complexfloating[Any, Any]]) -> NDArray[Any]:
+        x = np.ravel(x)
+        return kinetic_diag * x + potential @ x
+
+    def matmat(x: NDArray[np.complexfloating[Any, Any]]) -> NDArray[Any]:
+        return kinetic_diag[:, None] * x + potential @ x
+
+    # The Hamiltonian is Hermitian, so the adjoint products are the same
+    return LinearOperator(
+        potential.shape,
+        matvec=matvec,
+        rmatvec=matvec,
+        matmat=matmat,
+        rmatmat=matmat,
+        dtype=potential.dtype,
+    )
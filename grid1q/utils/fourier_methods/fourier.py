@@ -1,33 +1,162 @@
 """Fourier methods for 1D and 2D signals."""
 
+import functools
+import math
+from typing import Any
+
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
+
+try:
+    from scipy import fft as _fft
+
+    # Spread each transform over all available cores
+    _FFT_KWARGS: dict[str, Any] = {"workers": -1}
+except ImportError:  # pragma: no cover
+    from numpy import fft as _fft
+
+    _FFT_KWARGS = {}
+
+# Use the cached DFT matrix when k_max - k_min <= factor * log2(len(signal))
+_DIRECT_DFT_FACTOR = 2.0
+# Largest DFT matrix (in elements) that is built and cached, 2 MB at complex128
+_DIRECT_DFT_MAX_SIZE = 2**17
+# Number of cached DFT matrices, so the cache holds at most 32 MB
+_DIRECT_DFT_CACHE_SIZE = 16
+
+
+@functools.lru_cache(maxsize=_DIRECT_DFT_CACHE_SIZE)
+def _dft_matrix(
+    sig_len: int,
+    k_min: int,
+    k_max: int,
+    dtype: np.dtype[Any],
+) -> NDArray[np.complexfloating[Any, Any]]:
+    """Return the normalised DFT matrix for the frequencies [k_min, k_max).
+
+    The result is cached and marked read-only, so repeated transforms of the
+    same length and band reuse it.
+
+    Args:
+        sig_len: The length of the signal.
+        k_min: The minimum index of the DFT.
+        k_max: The maximum index of the DFT.
+        dtype: The complex data type of the matrix.
+
+    Returns:
+        The (k_max - k_min, sig_len) DFT matrix, divided by sig_len.
+    """
+    # exp(-2 pi i k n / N) only takes N distinct values, so gather from a table
+    omegas = (np.exp(-2j * np.pi * np.arange(sig_len) / sig_len) / sig_len).astype(
+        dtype,
+    )
+    matrix = omegas[np.outer(np.arange(k_min, k_max), np.arange(sig_len)) % sig_len]
+    matrix.setflags(write=False)
+    return matrix
+
+
+def _use_dft_matrix(sig_len: int, k_min: int, k_max: int) -> bool:
+    """Return whether the direct DFT matrix is cheaper than a full FFT.
+
+    Args:
+        sig_len: The length of the signal.
+        k_min: The minimum index of the DFT.
+        k_max: The maximum index of the DFT.
+
+    Returns:
+        True if the band is narrow enough for the matrix product to win.
+    """
+    n_k = k_max - k_min
+    return (
+        n_k <= _DIRECT_DFT_FACTOR * np.log2(max(sig_len, 2))
+        and n_k * sig_len <= _DIRECT_DFT_MAX_SIZE
+    )
+
+
+def _half_spectrum_index(
+    freqs: NDArray[np.int_],
+    sig_len: int,
+) -> tuple[NDArray[np.int_], NDArray[np.bool_]]:
+    """Map frequencies in [0, sig_len) onto the half spectrum of a real FFT.
+
+    The spectrum of a real signal satisfies X[k] = conj(X[sig_len - k]), so only
+    the frequencies up to sig_len // 2 are stored by rfft.
+
+    Args:
+        freqs: The frequencies, already reduced modulo sig_len.
+        sig_len: The length of the real signal.
+
+    Returns:
+        The index into the rfft output for each frequency, and whether that
+        value must be conjugated.
+    """
+    return np.minimum(freqs, sig_len - freqs), freqs > sig_len // 2
+
+
+def _complex_dtype(dtype: DTypeLike) -> np.dtype[Any]:
+    """Return dtype as a NumPy dtype, checking that it is complex.
+
+    Args:
+        dtype: The requested data type.
+
+    Returns:
+        The data type as a NumPy dtype.
+
+    Raises:
+        TypeError: If the data type is not a complex floating type.
+    """
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.complexfloating):
+        msg = f"dtype must be a complex floating type, got {dtype}."
+        raise TypeError(msg)
+    return dtype
 
 
 def dft(
     signal: NDArray[np.complex128],
     k_min: int,
     k_max: int,
-) -> NDArray[np.complex128]:
+    *,
+    dtype: DTypeLike = np.complex64,
+) -> NDArray[np.complexfloating[Any, Any]]:
     """Compute the Discrete Fourier Transform of a signal.
 
+    The signal is transformed at its own length and is not zero padded to
+    scipy.fft.next_fast_len, since padding would change the frequency grid.
+    Lengths with only small prime factors are fastest, large prime lengths use
+    Bluestein's algorithm inside the FFT backend and stay O(N log N).
+
     Args:
         signal: The input signal.
         k_min: The minimum index of the DFT.
         k_max: The maximum index of the DFT.
+        dtype: The complex data type used for the transform.
 
     Returns:
         The DFT of the signal.
+
+    Raises:
+        TypeError: If dtype is not a complex floating type.
     """
-    truncated_dft_result = np.zeros(k_max - k_min, dtype=complex)
+    dtype = _complex_dtype(dtype)
+    signal = np.asarray(signal)
+    is_real = np.isrealobj(signal)
+    signal = signal.astype(np.finfo(dtype).dtype if is_real else dtype, copy=False)
+    sig_len = len(signal)
+    if _use_dft_matrix(sig_len, k_min, k_max):
+        return _dft_matrix(sig_len, k_min, k_max, dtype) @ signal
+
+    # Frequencies outside [0, sig_len) alias back onto the periodic spectrum
+    freqs = np.arange(k_min, k_max) % sig_len
 
-    for k in range(k_min, k_max):
-        sum_result = 0
-        for n in range(len(signal)):
-            sum_result += signal[n] * np.exp(-1j * 2 * np.pi * k * n / len(signal))
-        truncated_dft_result[k - k_min] = sum_result / len(signal)
+    if is_real:
+        half_dft_result = _fft.rfft(signal, **_FFT_KWARGS) / sig_len
+        index, conjugate = _half_spectrum_index(freqs, sig_len)
+        values = half_dft_result[index]
+        return np.where(conjugate, np.conj(values), values)
 
-    return truncated_dft_result
+    full_dft_result = _fft.fft(signal, **_FFT_KWARGS) / sig_len
+    return full_dft_result[freqs]
 
 
 def idft(
@@ -35,7 +164,9 @@ def idft(
     sig_len: int,
     k_min: int,
     k_max: int,
-) -> NDArray[np.complex128]:
+    *,
+    dtype: DTypeLike = np.complex64,
+) -> NDArray[np.complexfloating[Any, Any]]:
     """Compute the Inverse Discrete Fourier Transform of a signal.
 
     Args:
@@ -43,48 +174,80 @@ def idft(
         sig_len: The length of the original signal.
         k_min: The minimum index of the DFT.
         k_max: The maximum index of the DFT.
+        dtype: The complex data type used for the transform.
 
     Returns:
         The IDFT of the signal.
+
+    Raises:
+        TypeError: If dtype is not a complex floating type.
     """
-    reconstructed_signal = np.zeros(sig_len, dtype=complex)
+    dtype = _complex_dtype(dtype)
+    truncated_dft_result = np.asarray(truncated_dft_result, dtype=dtype)
+    if _use_dft_matrix(sig_len, k_min, k_max):
+        # The inverse kernel is the conjugate of the cached forward one
+        matrix = _dft_matrix(sig_len, k_min, k_max, dtype)
+        return np.conj(np.conj(truncated_dft_result) @ matrix) * sig_len
+
+    full_dft_result = np.zeros(sig_len, dtype=dtype)
 
-    for n in range(sig_len):
-        sum_result = 0
-        for k in range(k_min, k_max):
-            sum_result += truncated_dft_result[k - k_min] * np.exp(
-                1j * 2 * np.pi * k * n / sig_len,
-            )
-        reconstructed_signal[n] = sum_result
+    # Accumulate so that aliased frequencies add onto the same bin
+    np.add.at(full_dft_result, np.arange(k_min, k_max) % sig_len, truncated_dft_result)
 
-    return reconstructed_signal
+    return _fft.ifft(full_dft_result, **_FFT_KWARGS) * sig_len
 
 
 def dft2(
     signal_2d: NDArray[np.complex128],
     k_min: int,
     k_max: int,
-) -> NDArray[np.complex128]:
+    *,
+    dtype: DTypeLike = np.complex64,
+) -> NDArray[np.complexfloating[Any, Any]]:
     """Compute the 2D Discrete Fourier Transform of a signal.
 
+    As with dft, each axis is transformed at its own length without padding.
+
     Args:
         signal_2d: The input 2D signal.
         k_min: The minimum index of the DFT.
         k_max: The maximum index of the DFT.
+        dtype: The complex data type used for the transform.
 
     Returns:
         The 2D DFT of the signal.
-    """
-    # Apply DFT to each row
-    dft_rows = np.array([dft(row, k_min, k_max) for row in signal_2d])
 
-    # Apply DFT to each column of the result
-    dft_columns = np.array(
-        [dft(dft_rows[:, col], k_min, k_max) for col in range(dft_rows.shape[1])],
+    Raises:
+        TypeError: If dtype is not a complex floating type.
+    """
+    dtype = _complex_dtype(dtype)
+    signal_2d = np.asarray(signal_2d)
+    is_real = np.isrealobj(signal_2d)
+    signal_2d = signal_2d.astype(
+        np.finfo(dtype).dtype if is_real else dtype,
+        copy=False,
     )
 
-    # Transpose the result back to the original orientation
-    return dft_columns.T
+    # Gather the same [k_min, k_max) window along both axes
+    k_range = np.arange(k_min, k_max)
+    n_rows, n_cols = signal_2d.shape
+    rows = k_range % n_rows
+    cols = k_range % n_cols
+
+    if is_real:
+        # rfft2 halves the last axis, X[a, b] = conj(X[-a, -b]) recovers the rest
+        half_dft_2d = _fft.rfft2(signal_2d, **_FFT_KWARGS) / signal_2d.size
+        col_index, conjugate = _half_spectrum_index(cols, n_cols)
+        row_index = np.where(
+            conjugate[None, :],
+            (-rows[:, None]) % n_rows,
+            rows[:, None],
+        )
+        values = half_dft_2d[row_index, col_index[None, :]]
+        return np.where(conjugate[None, :], np.conj(values), values)
+
+    full_dft_2d = _fft.fft2(signal_2d, **_FFT_KWARGS) / signal_2d.size
+    return full_dft_2d[np.ix_(rows, cols)]
 
 
 def idft2(
@@ -92,7 +255,9 @@ def idft2(
     original_shape: tuple[int, int],
     k_min: int,
     k_max: int,
-) -> NDArray[np.complex128]:
+    *,
+    dtype: DTypeLike = np.complex64,
+) -> NDArray[np.complexfloating[Any, Any]]:
     """Compute the 2D Inverse Discrete Fourier Transform of a signal.
 
     Args:
@@ -100,22 +265,22 @@ def idft2(
         original_shape: The shape of the original signal.
         k_min: The minimum index of the DFT.
         k_max: The maximum index of the DFT.
+        dtype: The complex data type used for the transform.
 
     Returns:
         The 2D IDFT of the signal.
+
+    Raises:
+        TypeError: If dtype is not a complex floating type.
     """
-    # Apply IDFT to each column
-    idft_cols = np.array(
-        [
-            idft(truncated_dft_2d[:, col], original_shape[0], k_min, k_max)
-            for col in range(truncated_dft_2d.shape[1])
-        ],
-    ).T
-
-    # Apply IDFT to each row of the result
-    return np.array(
-        [
-            idft(idft_cols[row], original_shape[1], k_min, k_max)
-            for row in range(idft_cols.shape[0])
-        ],
-    )
+    dtype = _complex_dtype(dtype)
+    truncated_dft_2d = np.asarray(truncated_dft_2d, dtype=dtype)
+    full_dft_2d = np.zeros(original_shape, dtype=dtype)
+
+    # Scatter back along both axes, accumulating aliased frequencies
+    k_range = np.arange(k_min, k_max)
+    rows = k_range % original_shape[0]
+    cols = k_range % original_shape[1]
+    np.add.at(full_dft_2d, np.ix_(rows, cols), truncated_dft_2d)
+
+    return _fft.ifft2(full_dft_2d, **_FFT_KWARGS) * math.prod(original_shape)
@@ -8,6 +8,8 @@ from numpy.typing import NDArray
 
 def plane_wave(
     coeffs_dict: dict[tuple[int, ...], np.complex128],
+    *,
+    normalise: bool = False,
 ) -> Callable[[NDArray[np.float64]], NDArray[np.complex128]]:
     """Return a function that represents a plane wave in ND space.
 
@@ -17,6 +19,8 @@ def plane_wave(
     Args:
         coeffs_dict: A dictionary where the keys are tuples of integers representing the
         wave vector and the values are the coefficients of the complex exponentials.
+        normalise: Whether the returned function normalises the plane wave over the
+        evaluated grid, as plane_wave_renorm does, in the same pass.
 
     Returns:
         A function that takes a vector r in ND space and returns the value of the plane
@@ -29,14 +33,17 @@ def plane_wave(
         space with wave vector (1,0) and (0,1), with expansion coefficients 0.4343
         and 0.343434 respectively.
     """
-    dim = len(next(iter(coeffs_dict.keys())))
+    # Stack the wave vectors and coefficients once for all evaluations
+    k_vectors = np.asarray(list(coeffs_dict.keys()), dtype=np.float64)
+    coeffs = np.asarray(list(coeffs_dict.values()), dtype=np.complex128)
 
     def space_function(
         r: NDArray[np.float64],
     ) -> NDArray[np.complex128]:  # Vectorised function
         """Return the value of the plane wave at r.
 
-        It is not normalised and you must use plane_wave_renorm to normalise it.
+        It is only normalised when plane_wave was called with normalise=True,
+        otherwise you must use plane_wave_renorm to normalise it.
         Where the x,y ... are stacked in a vector r = [x,y,...].
 
         Args:
@@ -45,13 +52,11 @@ def plane_wave(
         Returns:
             The value of the plane wave at r.
         """
-        return sum(
-            [
-                coeffs_dict[k]
-                * np.exp(np.pi * 1j * np.tensordot(r, k, axes=([dim], [0])))
-                for k in coeffs_dict
-            ],
-        )  # type: ignore  # noqa: PGH003
+        values = np.exp(np.pi * 1j * (r @ k_vectors.T)) @ coeffs
+        if normalise:
+            # Scale the freshly built buffer in place rather than copying it
+            values *= 1.0 / np.sqrt(np.vdot(values, values).real)
+        return values
 
     return space_function
 
@@ -65,6 +70,7 @@ def plane_wave_renorm(plane_wave_r: NDArray[np.complex128]) -> NDArray[np.comple
     Returns:
         The normalised plane wave.
     """
-    pw_flat = plane_wave_r.flatten()
-    pw_flat_norm = pw_flat / np.linalg.norm(pw_flat)
-    return pw_flat_norm.reshape(plane_wave_r.shape)
+    plane_wave_r = np.asarray(plane_wave_r)
+    # vdot sums |psi|^2 over the flattened array without an intermediate copy
+    norm2 = np.vdot(plane_wave_r, plane_wave_r).real
+    return plane_wave_r * (1.0 / np.sqrt(norm2))
@@ -0,0 +1,162 @@
+"""Tests for grid1q.utils.fourier_methods module."""
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from grid1q.utils.fourier_methods import dft, dft2, fourier, idft, idft2
+
+RTOL = {np.complex64: 1e-4, np.complex128: 1e-10}
+
+# (signal length, k_min, k_max): centred, aliased past the length, offset
+# and narrow enough to take the cached DFT matrix path
+WINDOWS_1D = [(16, -4, 4), (13, -20, 20), (31, 3, 9), (64, -2, 2), (17, 0, 17)]
+WINDOWS_2D = [((8, 8), -3, 3), ((6, 10), 0, 6), ((5, 7), -8, 8)]
+
+
+def direct_dft(signal: NDArray[np.complex128], k_min: int, k_max: int) -> NDArray:
+    """Return the truncated DFT as a direct sum."""
+    n = np.arange(len(signal))
+    return np.array(
+        [
+            np.sum(signal * np.exp(-2j * np.pi * k * n / len(signal))) / len(signal)
+            for k in range(k_min, k_max)
+        ],
+    )
+
+
+def direct_idft(coeffs: NDArray, sig_len: int, k_min: int, k_max: int) -> NDArray:
+    """Return the inverse of a truncated DFT as a direct sum."""
+    k = np.arange(k_min, k_max)
+    return np.array(
+        [np.sum(coeffs * np.exp(2j * np.pi * k * n / sig_len)) for n in range(sig_len)],
+    )
+
+
+def direct_dft2(signal_2d: NDArray, k_min: int, k_max: int) -> NDArray:
+    """Return the truncated 2D DFT as a direct sum."""
+    m = np.arange(signal_2d.shape[0])[:, None]
+    n = np.arange(signal_2d.shape[1])[None, :]
+    return np.array(
+        [
+            [
+                np.sum(
+                    signal_2d
+                    * np.exp(
+                        -2j
+                        * np.pi
+                        * (a * m / signal_2d.shape[0] + b * n / signal_2d.shape[1]),
+                    ),
+                )
+                / signal_2d.size
+                for b in range(k_min, k_max)
+            ]
+            for a in range(k_min, k_max)
+        ],
+    )
+
+
+def direct_idft2(
+    coeffs_2d: NDArray,
+    original_shape: tuple[int, int],
+    k_min: int,
+    k_max: int,
+) -> NDArray:
+    """Return the inverse of a truncated 2D DFT as a direct sum."""
+    a = np.arange(k_min, k_max)[:, None]
+    b = np.arange(k_min, k_max)[None, :]
+    return np.array(
+        [
+            [
+                np.sum(
+                    coeffs_2d
+                    * np.exp(
+                        2j
+                        * np.pi
+                        * (a * m / original_shape[0] + b * n / original_shape[1]),
+                    ),
+                )
+                for n in range(original_shape[1])
+            ]
+            for m in range(original_shape[0])
+        ],
+    )
+
+
+def random_signal(shape: int | tuple[int, ...], *, real: bool) -> NDArray:
+    """Return a reproducible random real or complex signal."""
+    rng = np.random.default_rng(1234)
+    signal = rng.normal(size=shape)
+    return signal if real else signal + 1j * rng.normal(size=shape)
+
+
+def assert_matches(result: NDArray, expected: NDArray, dtype: type) -> None:
+    """Assert that result matches expected to the precision of dtype."""
+    assert result.dtype == dtype
+    atol = RTOL[dtype] * max(1.0, np.max(np.abs(expected)))
+    np.testing.assert_allclose(result, expected, rtol=0, atol=atol)
+
+
+@pytest.mark.parametrize("dtype", [np.complex64, np.complex128])
+@pytest.mark.parametrize("real", [True, False])
+@pytest.mark.parametrize(("sig_len", "k_min", "k_max"), WINDOWS_1D)
+def test_dft(sig_len: int, k_min: int, k_max: int, *, real: bool, dtype: type):
+    """Test dft and idft against the direct sums."""
+    signal = random_signal(sig_len, real=real)
+    coeffs = direct_dft(signal, k_min, k_max)
+    assert_matches(dft(signal, k_min, k_max, dtype=dtype), coeffs, dtype)
+    assert_matches(
+        idft(coeffs, sig_len, k_min, k_max, dtype=dtype),
+        direct_idft(coeffs, sig_len, k_min, k_max),
+        dtype,
+    )
+
+
+@pytest.mark.parametrize("dtype", [np.complex64, np.complex128])
+@pytest.mark.parametrize("real", [True, False])
+@pytest.mark.parametrize(("shape", "k_min", "k_max"), WINDOWS_2D)
+def test_dft2(
+    shape: tuple[int, int],
+    k_min: int,
+    k_max: int,
+    *,
+    real: bool,
+    dtype: type,
+):
+    """Test dft2 and idft2 against the direct sums."""
+    signal_2d = random_signal(shape, real=real)
+    coeffs_2d = direct_dft2(signal_2d, k_min, k_max)
+    assert_matches(dft2(signal_2d, k_min, k_max, dtype=dtype), coeffs_2d, dtype)
+    assert_matches(
+        idft2(coeffs_2d, shape, k_min, k_max, dtype=dtype),
+        direct_idft2(coeffs_2d, shape, k_min, k_max),
+        dtype,
+    )
+
+
+def test_dft_matrix_cache_is_bounded():
+    """Test that the cached DFT matrices stay within a few tens of MB."""
+    max_bytes = (
+        fourier._DIRECT_DFT_CACHE_SIZE  # noqa: SLF001
+        * fourier._DIRECT_DFT_MAX_SIZE  # noqa: SLF001
+        * np.dtype(np.complex128).itemsize
+    )
+    assert max_bytes <= 32 * 2**20
+    assert not fourier._use_dft_matrix(2**16, 0, 4)  # noqa: SLF001
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int64])
+def test_real_dtype_is_rejected(dtype: type):
+    """Test that a non-complex dtype raises a TypeError on both transform paths."""
+    signal = random_signal(16, real=False)
+    # (16, -4, 4) takes the cached DFT matrix, (16, 0, 16) the FFT
+    for k_min, k_max in [(-4, 4), (0, 16)]:
+        with pytest.raises(TypeError, match="complex"):
+            dft(signal, k_min, k_max, dtype=dtype)
+        with pytest.raises(TypeError, match="complex"):
+            idft(signal[: k_max - k_min], 16, k_min, k_max, dtype=dtype)
+    signal_2d = random_signal((6, 6), real=False)
+    with pytest.raises(TypeError, match="complex"):
+        dft2(signal_2d, -2, 2, dtype=dtype)
+    with pytest.raises(TypeError, match="complex"):
+        idft2(signal_2d[:4, :4], (6, 6), -2, 2, dtype=dtype)
@@ -0,0 +1,258 @@
+"""Tests for grid1q.operators.plane_wave module."""
+
+import itertools
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from grid1q.operators import plane_wave
+from grid1q.operators.plane_wave import (
+    elec_nuc_potential,
+    kenetic,
+    plane_wave_hamiltonian,
+    plane_wave_hamiltonian_linop,
+)
+
+RTOL = {np.complex64: 1e-5, np.complex128: 1e-12}
+
+
+def direct_potential(
+    k_points: NDArray[np.float64],
+    cell_area: float,
+    r_pos: NDArray[np.float64],
+) -> NDArray[np.complex128]:
+    """Return the electron-nucleus potential as a direct sum over all elements."""
+    n_k = len(k_points)
+    mat = np.zeros((n_k, n_k), dtype=complex)
+    for i, k_bra in enumerate(k_points):
+        for j, k_ket in enumerate(k_points):
+            d_k = np.subtract(k_bra, k_ket, dtype=float)
+            if np.any(d_k):
+                for r in r_pos:
+                    mat[i, j] += (
+                        (4 * np.pi)
+                        / (cell_area * np.dot(d_k, d_k))
+                        * (np.exp(-1j * np.dot(d_k, r)))
+                    )
+    return mat
+
+
+def k_grid(dim: int) -> NDArray[np.int64]:
+    """Return a small (N, dim) grid of integer k points."""
+    ks = range(-3, 3) if dim < 3 else range(-2, 2)
+    return np.array(list(itertools.product(ks, repeat=dim)))
+
+
+def nuclei(dim: int) -> NDArray[np.float64]:
+    """Return two nuclear positions in dim dimensions."""
+    return np.array([np.full(dim, 0.5), np.linspace(0.1, 0.3, dim)])
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def potential_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    """Run the test with the Numba kernel and with the tiled NumPy kernel."""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(plane_wave, "numba", None)
+        # A small tile exercises several row blocks and their mirrored halves
+        monkeypatch.setattr(plane_wave, "_POTENTIAL_TILE", 5)
+    return request.param
+
+
+def test_kenetic_flat_1d_k_points():
+    """Test that flat (N,) k points give the same diagonal as (N, 1) k points."""
+    k_points = np.arange(-3, 3)
+    expected = [40.5, 8.0, 0.5, 0.0, 0.5, 8.0]
+    np.testing.assert_allclose(kenetic(k_points), expected)
+    np.testing.assert_allclose(kenetic(k_points[:, None]), expected)
+
+
+def test_elec_nuc_potential_flat_1d_inputs():
+    """Test that flat 1D k points and nuclear positions are accepted."""
+    k_points = np.arange(-3, 3)
+    r_pos = np.array([0.5, 0.2])
+    expected = direct_potential(k_points[:, None], 1.3, r_pos[:, None])
+    np.testing.assert_allclose(
+        elec_nuc_potential(k_points, 1.3, r_pos, dtype=np.complex128),
+        expected,
+        atol=1e-12,
+    )
+
+
+@pytest.mark.parametrize("dim", [1, 2, 3])
+def test_kenetic(dim: int):
+    """Test kenetic against the per k point formula."""
+    k_points = k_grid(dim)
+    expected = [np.dot(k, k) ** 2 / 2 for k in k_points]
+    np.testing.assert_allclose(kenetic(k_points), expected)
+    np.testing.assert_allclose(
+        kenetic(k_points, hbar=2.0, m=3.0),
+        np.multiply(expected, 4.0 / 3.0),
+    )
+
+
+@pytest.mark.usefixtures("potential_backend")
+@pytest.mark.parametrize("dtype", [np.complex64, np.complex128])
+@pytest.mark.parametrize("dim", [1, 2, 3])
+def test_elec_nuc_potential(dim: int, dtype: type):
+    """Test elec_nuc_potential against the direct sum."""
+    k_points = k_grid(dim)
+    expected = direct_potential(k_points, 1.3, nuclei(dim))
+    result = elec_nuc_potential(k_points, 1.3, nuclei(dim), dtype=dtype)
+    assert result.dtype == dtype
+    np.testing.assert_allclose(
+        result,
+        expected,
+        rtol=0,
+        atol=RTOL[dtype] * np.max(np.abs(expected)),
+    )
+
+
+@pytest.mark.usefixtures("potential_backend")
+def test_elec_nuc_potential_repeated_k_points():
+    """Test that equal k points off the diagonal give a zero element."""
+    k_points = np.array([[0.0], [0.0], [1.0]])
+    result = elec_nuc_potential(k_points, 1.0, [[0.5]], dtype=np.complex128)
+    assert result[0, 1] == 0
+    assert result[1, 0] == 0
+    np.testing.assert_allclose(result, direct_potential(k_points, 1.0, [[0.5]]))
+
+
+@pytest.mark.usefixtures("potential_backend")
+@pytest.mark.parametrize("dim", [1, 2])
+def test_plane_wave_hamiltonian(dim: int):
+    """Test that the Hamiltonian is the potential plus the kinetic diagonal."""
+    k_points = k_grid(dim)
+    expected = direct_potential(k_points, 1.3, nuclei(dim)) + np.diag(
+        kenetic(k_points),
+    )
+    np.testing.assert_allclose(
+        plane_wave_hamiltonian(k_points, 1.3, nuclei(dim), dtype=np.complex128),
+        expected,
+        rtol=0,
+        atol=1e-12 * np.max(np.abs(expected)),
+    )
+
+
+def test_elec_nuc_potential_dimension_mismatch():
+    """Test that k points and nuclei of different dimension are rejected."""
+    with pytest.raises(ValueError, match="2D"):
+        elec_nuc_potential(k_grid(2), 1.0, [[0.5]])
+
+
+@pytest.mark.usefixtures("potential_backend")
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int64])
+def test_real_dtype_is_rejected(dtype: type):
+    """Test that a non-complex dtype raises a TypeError."""
+    with pytest.raises(TypeError, match="complex"):
+        elec_nuc_potential(k_grid(1), 1.0, [[0.5]], dtype=dtype)
+    with pytest.raises(TypeError, match="complex"):
+        plane_wave_hamiltonian(k_grid(1), 1.0, [[0.5]], dtype=dtype)
+    if plane_wave.LinearOperator is not None:
+        with pytest.raises(TypeError, match="complex"):
+            plane_wave_hamiltonian_linop(k_grid(1), 1.0, [[0.5]], dtype=dtype)
+
+
+@pytest.mark.usefixtures("potential_backend")
+@pytest.mark.parametrize("dim", [1, 2, 3])
+def test_zero_k_points(dim: int):
+    """Test that an empty set of k points gives empty operators."""
+    k_points = np.zeros((0, dim))
+    assert kenetic(k_points).shape == (0,)
+    assert elec_nuc_potential(k_points, 1.3, nuclei(dim)).shape == (0, 0)
+    assert plane_wave_hamiltonian(k_points, 1.3, nuclei(dim)).shape == (0, 0)
+
+
+@pytest.mark.usefixtures("potential_backend")
+@pytest.mark.parametrize("dim", [1, 2, 3])
+def test_zero_nuclei(dim: int):
+    """Test that no nuclei give a zero potential and a kinetic-only Hamiltonian."""
+    k_points = k_grid(dim)
+    r_pos = np.zeros((0, dim))
+    np.testing.assert_array_equal(
+        elec_nuc_potential(k_points, 1.3, r_pos),
+        np.zeros((len(k_points), len(k_points))),
+    )
+    np.testing.assert_allclose(
+        plane_wave_hamiltonian(k_points, 1.3, r_pos),
+        np.diag(kenetic(k_points)),
+    )
+
+
+@pytest.mark.parametrize("dtype", [np.complex64, np.complex128])
+def test_plane_wave_hamiltonian_linop(dtype: type):
+    """Test the LinearOperator products and eigenvalues against the dense matrix."""
+    linalg = pytest.importorskip("scipy.sparse.linalg")
+    k_points = k_grid(2)
+    dense = plane_wave_hamiltonian(k_points, 1.3, nuclei(2), dtype=np.complex128)
+    linop = plane_wave_hamiltonian_linop(k_points, 1.3, nuclei(2), dtype=dtype)
+    assert linop.shape == dense.shape
+    assert linop.dtype == dtype
+
+    rng = np.random.default_rng(1234)
+    x = rng.normal(size=len(k_points)) + 1j * rng.normal(size=len(k_points))
+    x_mat = rng.normal(size=(len(k_points), 3))
+    atol = RTOL[dtype] * np.max(np.abs(dense)) * len(k_points)
+    np.testing.assert_allclose(linop.matvec(x), dense @ x, rtol=0, atol=atol)
+    np.testing.assert_allclose(linop.matmat(x_mat), dense @ x_mat, rtol=0, atol=atol)
+    np.testing.assert_allclose(
+        linop.rmatvec(x),
+        dense.conj().T @ x,
+        rtol=0,
+        atol=atol,
+    )
+
+    eigvals = np.sort(linalg.eigsh(linop, k=4, which="SA")[0])
+    np.testing.assert_allclose(
+        eigvals,
+        np.linalg.eigvalsh(dense)[:4],
+        rtol=0,
+        atol=10 * RTOL[dtype] * np.max(np.abs(dense)),
+    )
+
+
+def test_plane_wave_hamiltonian_linop_without_scipy(monkeypatch: pytest.MonkeyPatch):
+    """Test that a clear ImportError is raised when SciPy is not installed."""
+    monkeypatch.setattr(plane_wave, "LinearOperator", None)
+    with pytest.raises(ImportError, match="SciPy"):
+        plane_wave_hamiltonian_linop(k_grid(1), 1.0, [[0.5]])
+
+
+def test_elec_nuc_potential_gpu_without_cupy(monkeypatch: pytest.MonkeyPatch):
+    """Test that use_gpu raises a clear ImportError when CuPy is not installed."""
+    monkeypatch.setattr(plane_wave, "cupy", None)
+    with pytest.raises(ImportError, match="CuPy"):
+        elec_nuc_potential(k_grid(1), 1.0, [[0.5]], use_gpu=True)
+
+
+@pytest.mark.parametrize("dim", [1, 2, 3])
+def test_elec_nuc_potential_gpu(monkeypatch: pytest.MonkeyPatch, dim: int):
+    """Test the use_gpu branch with a NumPy-backed stand-in for CuPy."""
+    fake_cupy = SimpleNamespace(
+        asarray=np.asarray,
+        asnumpy=np.asarray,
+        empty=np.empty,
+        zeros=np.zeros,
+        exp=np.exp,
+        ascontiguousarray=np.ascontiguousarray,
+    )
+    monkeypatch.setattr(plane_wave, "cupy", fake_cupy)
+    monkeypatch.setattr(plane_wave, "_POTENTIAL_TILE", 5)
+    k_points = k_grid(dim)
+    result = elec_nuc_potential(
+        k_points,
+        1.3,
+        nuclei(dim),
+        dtype=np.complex128,
+        use_gpu=True,
+    )
+    assert result.dtype == np.complex128
+    np.testing.assert_allclose(
+        result,
+        elec_nuc_potential(k_points, 1.3, nuclei(dim), dtype=np.complex128),
+        rtol=0,
+        atol=RTOL[np.complex128] * np.max(np.abs(result)),
+    )
@@ -0,0 +1,53 @@
+"""Tests for grid1q.wavefunctions.plane_wave module."""
+
+import itertools
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from grid1q.wavefunctions.plane_wave import plane_wave, plane_wave_renorm
+
+
+def coeffs_and_grid(
+    dim: int,
+) -> tuple[dict[tuple[int, ...], np.complex128], NDArray[np.float64]]:
+    """Return random expansion coefficients and a grid of points in dim dimensions."""
+    rng = np.random.default_rng(1234)
+    k_vectors = itertools.product(range(-2, 2), repeat=dim)
+    coeffs = {k: np.complex128(rng.normal() + 1j * rng.normal()) for k in k_vectors}
+    xs = np.linspace(0, 1, 5)
+    grid = np.stack(np.meshgrid(*[xs] * dim), axis=-1)
+    return coeffs, grid
+
+
+@pytest.mark.parametrize("dim", [1, 2, 3])
+def test_plane_wave(dim: int):
+    """Test the plane wave against the direct sum over its terms."""
+    coeffs, grid = coeffs_and_grid(dim)
+    expected = sum(
+        c * np.exp(np.pi * 1j * np.tensordot(grid, k, axes=([dim], [0])))
+        for k, c in coeffs.items()
+    )
+    np.testing.assert_allclose(plane_wave(coeffs)(grid), expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("dim", [1, 2])
+def test_plane_wave_renorm(dim: int):
+    """Test that plane_wave_renorm gives unit norm and keeps the direction."""
+    coeffs, grid = coeffs_and_grid(dim)
+    values = plane_wave(coeffs)(grid)
+    renormed = plane_wave_renorm(values)
+    assert renormed.shape == values.shape
+    np.testing.assert_allclose(np.linalg.norm(renormed), 1.0)
+    np.testing.assert_allclose(renormed * np.linalg.norm(values), values)
+
+
+@pytest.mark.parametrize("dim", [1, 2])
+def test_plane_wave_normalise(dim: int):
+    """Test that normalise=True matches plane_wave_renorm."""
+    coeffs, grid = coeffs_and_grid(dim)
+    np.testing.assert_allclose(
+        plane_wave(coeffs, normalise=True)(grid),
+        plane_wave_renorm(plane_wave(coeffs)(grid)),
+    )